@@ -2,6 +2,7 @@
 ASCII Cinema - Convert images and videos to ASCII art
 """
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
@@ -10,8 +11,12 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.frames import FrameStore
+from ascii_cinema.kernels import KernelBackend
 from ascii_cinema.player import ASCIIPlayer
+from ascii_cinema.profiling import MemoryProfiler, warm_up
 from ascii_cinema.styles import ASCIIStyle
+from ascii_cinema.terminal import DisplayBackend
 
 app = typer.Typer(
     name="ascii-cinema",
@@ -21,6 +26,11 @@ app = typer.Typer(
 console = Console()
 
 
+def _print_memory_report(profiler: MemoryProfiler, frames: Optional[FrameStore] = None) -> None:
+    """Print a memory report gathered with --profile-memory."""
+    console.print(profiler.report(frames), markup=False, highlight=False, soft_wrap=True)
+
+
 @app.command()
 def image(
     path: Path = typer.Argument(..., help="Path to the image file"),
@@ -30,29 +40,52 @@ def image(
     ),
     color: bool = typer.Option(False, "--color", "-c", help="Use colored output"),
     invert: bool = typer.Option(False, "--invert", "-i", help="Invert brightness"),
+    compact: bool = typer.Option(
+        False, "--compact", help="Half blocks: pack two glyph rows into each cell"
+    ),
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Save to file instead of displaying"
     ),
+    backend: KernelBackend = typer.Option(
+        KernelBackend.AUTO, "--backend", "-b", help="Conversion kernel backend"
+    ),
+    profile_memory: bool = typer.Option(
+        False, "--profile-memory", help="Report peak memory and top allocators on exit"
+    ),
 ) -> None:
     """Convert an image to ASCII art."""
     if not path.exists():
         console.print(f"[red]Error: File not found: {path}[/red]")
         raise typer.Exit(1)
 
+    profiler = MemoryProfiler()
     try:
-        converter = ASCIIConverter(width=width, style=style, invert=invert)
-        ascii_art = converter.image_to_ascii(path, use_color=color)
-
-        if output:
-            output.write_text(ascii_art)
-            console.print(f"[green]✓[/green] Saved to {output}")
-        else:
-            console.print(ascii_art)
+        converter = ASCIIConverter(
+            width=width,
+            style=style,
+            invert=invert,
+            backend=backend,
+            compact=compact,
+        )
+        if profile_memory:
+            # Keep lazy imports and kernel compilation out of the report
+            warm_up(converter, color)
+        with profiler if profile_memory else nullcontext():
+            ascii_art = converter.image_to_ascii(path, use_color=color)
+
+            if output:
+                output.write_text(ascii_art)
+                console.print(f"[green]✓[/green] Saved to {output}")
+            else:
+                console.print(ascii_art)
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
+    if profile_memory:
+        _print_memory_report(profiler)
+
 
 @app.command()
 def video(
@@ -63,14 +96,31 @@ def video(
     ),
     color: bool = typer.Option(True, "--color/--no-color", help="Use colored output"),
     invert: bool = typer.Option(False, "--invert", "-i", help="Invert brightness"),
+    compact: bool = typer.Option(
+        False, "--compact", help="Half blocks: pack two glyph rows into each cell"
+    ),
     fps: Optional[float] = typer.Option(None, "--fps", "-f", help="Frames per second"),
     loop: bool = typer.Option(True, "--loop/--no-loop", help="Loop the animation"),
+    segments: int = typer.Option(
+        1, "--segments", help="Decode video files in this many chunks (one worker per CPU)"
+    ),
+    display: DisplayBackend = typer.Option(
+        DisplayBackend.RICH, "--display", "-d", help="Terminal output backend"
+    ),
+    backend: KernelBackend = typer.Option(
+        KernelBackend.AUTO, "--backend", "-b", help="Conversion kernel backend"
+    ),
+    profile_memory: bool = typer.Option(
+        False, "--profile-memory", help="Report peak memory and top allocators on exit"
+    ),
 ) -> None:
     """Play a video or GIF as ASCII art animation."""
     if not path.exists():
         console.print(f"[red]Error: File not found: {path}[/red]")
         raise typer.Exit(1)
 
+    profiler = MemoryProfiler()
+    player: Optional[ASCIIPlayer] = None
     try:
         with Progress(
             SpinnerColumn(),
@@ -79,11 +129,30 @@ def video(
         ) as progress:
             task = progress.add_task("Loading video...", total=None)
             
-            converter = ASCIIConverter(width=width, style=style, invert=invert)
-            player = ASCIIPlayer(converter, console)
+            converter = ASCIIConverter(
+                width=width,
+                style=style,
+                invert=invert,
+                backend=backend,
+                compact=compact,
+            )
+            if profile_memory:
+                # Keep lazy imports and kernel compilation out of the report
+                warm_up(converter, color)
+            player = ASCIIPlayer(converter, console, display=display)
             
             progress.update(task, description="Converting frames...")
-            player.play_video(path, use_color=color, target_fps=fps, loop=loop)
+            with profiler if profile_memory else nullcontext():
+                player.play_video(
+                    path,
+                    use_color=color,
+                    target_fps=fps,
+                    loop=loop,
+                    segments=segments,
+                    # The spinner's refresh thread would interleave with raw writes,
+                    # so keep it for the conversion and stop it before playback
+                    on_loaded=progress.stop if display is DisplayBackend.RAW else None,
+                )
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Playback stopped[/yellow]")
@@ -91,6 +160,9 @@ def video(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
+    if profile_memory:
+        _print_memory_report(profiler, player.frames if player else None)
+
 
 @app.command()
 def webcam(
@@ -100,6 +172,18 @@ def webcam(
     ),
     color: bool = typer.Option(True, "--color/--no-color", help="Use colored output"),
     invert: bool = typer.Option(False, "--invert", "-i", help="Invert brightness"),
+    compact: bool = typer.Option(
+        False, "--compact", help="Half blocks: pack two glyph rows into each cell"
+    ),
+    display: DisplayBackend = typer.Option(
+        DisplayBackend.RICH, "--display", "-d", help="Terminal output backend"
+    ),
+    backend: KernelBackend = typer.Option(
+        KernelBackend.AUTO, "--backend", "-b", help="Conversion kernel backend"
+    ),
+    profile_memory: bool = typer.Option(
+        False, "--profile-memory", help="Report peak memory and top allocators on exit"
+    ),
 ) -> None:
     """Stream ASCII art from your webcam (requires opencv-python)."""
     try:
@@ -111,12 +195,23 @@ def webcam(
         )
         raise typer.Exit(1)
 
+    profiler = MemoryProfiler()
     try:
-        converter = ASCIIConverter(width=width, style=style, invert=invert)
-        player = ASCIIPlayer(converter, console)
-        
-        console.print("[cyan]Starting webcam... Press Ctrl+C to stop[/cyan]\n")
-        player.play_webcam(use_color=color)
+        converter = ASCIIConverter(
+            width=width,
+            style=style,
+            invert=invert,
+            backend=backend,
+            compact=compact,
+        )
+        if profile_memory:
+            # Keep lazy imports and kernel compilation out of the report
+            warm_up(converter, color)
+        with profiler if profile_memory else nullcontext():
+            player = ASCIIPlayer(converter, console, display=display)
+            
+            console.print("[cyan]Starting webcam... Press Ctrl+C to stop[/cyan]\n")
+            player.play_webcam(use_color=color)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Webcam stopped[/yellow]")
@@ -124,6 +219,9 @@ def webcam(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
+    if profile_memory:
+        _print_memory_report(profiler)
+
 
 def main() -> None:
     """Main entry point."""
@@ -0,0 +1,132 @@
+"""
+Numba-compiled conversion kernels for ASCII Cinema
+
+Imported lazily by NumbaKernels; every function must match the
+NumpyKernels reference output exactly.
+"""
+import numpy as np
+from numba import njit
+
+# b"\033[38;2;" and b"\033[0m"
+_COLOR_PREFIX = np.array([27, 91, 51, 56, 59, 50, 59], dtype=np.uint8)
+_COLOR_RESET = np.array([27, 91, 48, 109], dtype=np.uint8)
+_NEWLINE = 10
+_SEMICOLON = 59
+_LETTER_M = 109
+
+
+@njit(cache=True)
+def luma(pixels):  # type: ignore[no-untyped-def]
+    count, height, width, _ = pixels.shape
+    gray = np.empty((count, height, width), dtype=np.float64)
+    for n in range(count):
+        for y in range(height):
+            for x in range(width):
+                # Same operation order as the NumPy reference
+                gray[n, y, x] = (
+                    pixels[n, y, x, 0] * 0.299
+                    + pixels[n, y, x, 1] * 0.587
+                    + pixels[n, y, x, 2] * 0.114
+                )
+    return gray
+
+
+@njit(cache=True)
+def quantize(gray, levels):  # type: ignore[no-untyped-def]
+    count, height, width = gray.shape
+    indices = np.empty((count, height, width), dtype=np.int64)
+    for n in range(count):
+        for y in range(height):
+            for x in range(width):
+                indices[n, y, x] = np.int64(gray[n, y, x] / 255 * (levels - 1))
+    return indices
+
+
+@njit(cache=True)
+def _digits(value):  # type: ignore[no-untyped-def]
+    if value >= 100:
+        return 3
+    if value >= 10:
+        return 2
+    return 1
+
+
+@njit(cache=True)
+def _write_number(buffer, pos, value):  # type: ignore[no-untyped-def]
+    size = _digits(value)
+    for i in range(size - 1, -1, -1):
+        buffer[pos + i] = 48 + value % 10
+        value //= 10
+    return pos + size
+
+
+@njit(cache=True)
+def glyph_map(indices, glyph_bytes, glyph_lengths):  # type: ignore[no-untyped-def]
+    count, height, width = indices.shape
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    for n in range(count):
+        size = max(height - 1, 0)
+        for y in range(height):
+            for x in range(width):
+                size += glyph_lengths[indices[n, y, x]]
+        offsets[n + 1] = offsets[n] + size
+
+    buffer = np.empty(offsets[count], dtype=np.uint8)
+    for n in range(count):
+        pos = offsets[n]
+        for y in range(height):
+            if y:
+                buffer[pos] = _NEWLINE
+                pos += 1
+            for x in range(width):
+                glyph = indices[n, y, x]
+                for i in range(glyph_lengths[glyph]):
+                    buffer[pos] = glyph_bytes[glyph, i]
+                    pos += 1
+    return buffer, offsets
+
+
+@njit(cache=True)
+def color_encode(pixels, indices, glyph_bytes, glyph_lengths):  # type: ignore[no-untyped-def]
+    count, height, width = indices.shape
+    fixed = len(_COLOR_PREFIX) + 2 + 1 + len(_COLOR_RESET)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    for n in range(count):
+        size = max(height - 1, 0)
+        for y in range(height):
+            for x in range(width):
+                size += (
+                    fixed
+                    + _digits(pixels[n, y, x, 0])
+                    + _digits(pixels[n, y, x, 1])
+                    + _digits(pixels[n, y, x, 2])
+                    + glyph_lengths[indices[n, y, x]]
+                )
+        offsets[n + 1] = offsets[n] + size
+
+    buffer = np.empty(offsets[count], dtype=np.uint8)
+    for n in range(count):
+        pos = offsets[n]
+        for y in range(height):
+            if y:
+                buffer[pos] = _NEWLINE
+                pos += 1
+            for x in range(width):
+                for i in range(len(_COLOR_PREFIX)):
+                    buffer[pos] = _COLOR_PREFIX[i]
+                    pos += 1
+                pos = _write_number(buffer, pos, pixels[n, y, x, 0])
+                buffer[pos] = _SEMICOLON
+                pos = _write_number(buffer, pos + 1, pixels[n, y, x, 1])
+                buffer[pos] = _SEMICOLON
+                pos = _write_number(buffer, pos + 1, pixels[n, y, x, 2])
+                buffer[pos] = _LETTER_M
+                pos += 1
+                glyph = indices[n, y, x]
+                for i in range(glyph_lengths[glyph]):
+                    buffer[pos] = glyph_bytes[glyph, i]
+                    pos += 1
+                for i in range(len(_COLOR_RESET)):
+                    buffer[pos] = _COLOR_RESET[i]
+                    pos += 1
+    return buffer, offsets
@@ -2,11 +2,12 @@
 Core conversion logic for ASCII Cinema
 """
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy as np
 from PIL import Image
 
+from ascii_cinema.kernels import KernelBackend, load_kernels
 from ascii_cinema.styles import ASCIIStyle
 
 
@@ -14,7 +15,12 @@ class ASCIIConverter:
     """Converts images to ASCII art."""
 
     def __init__(
-        self, width: int = 100, style: ASCIIStyle = ASCIIStyle.STANDARD, invert: bool = False
+        self,
+        width: int = 100,
+        style: ASCIIStyle = ASCIIStyle.STANDARD,
+        invert: bool = False,
+        backend: KernelBackend = KernelBackend.AUTO,
+        compact: bool = False,
     ):
         """
         Initialize the converter.
@@ -23,11 +29,16 @@ class ASCIIConverter:
             width: Target width in characters
             style: ASCII character style to use
             invert: Whether to invert brightness mapping
+            backend: Kernel implementation for the conversion hot loop
+            compact: Pack two glyph rows into each half-block cell instead of
+                doubling the vertical resolution (half_blocks style only)
         """
         self.width = width
         self.style = style
         self.invert = invert
+        self.compact = compact
         self.chars = self._get_chars()
+        self.kernels = load_kernels(backend)
 
     def _get_chars(self) -> str:
         """Get the character set for the selected style."""
@@ -59,6 +70,10 @@ class ASCIIConverter:
         Returns:
             ASCII art string
         """
+        if self.style is ASCIIStyle.HALF_BLOCKS:
+            pixels = self._half_block_pixels(img)
+            return self._render_half_blocks(pixels[np.newaxis], use_color)[0]
+
         # Calculate height maintaining aspect ratio
         aspect_ratio = img.height / img.width
         height = int(self.width * aspect_ratio * 0.55)  # 0.55 to account for char height
@@ -73,28 +88,106 @@ class ASCIIConverter:
         # Convert to numpy array for faster processing
         pixels = np.array(img)
 
+        return self._render_batch(pixels[np.newaxis], use_color)[0]
+
+    def frames_to_ascii(self, frames: np.ndarray, use_color: bool = False) -> List[str]:
+        """
+        Convert a stack of same-size frames to ASCII art in one pass.
+
+        Frames are resized one by one, then luma, glyph indices and color
+        codes are computed for the whole stack at once.
+
+        Args:
+            frames: Frames as an (N, H, W, 3) RGB uint8 array
+            use_color: Whether to use ANSI color codes
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
+        if len(frames) == 0:
+            return []
+
+        if self.style is ASCIIStyle.HALF_BLOCKS:
+            pixels = np.stack([self._half_block_pixels(Image.fromarray(frame)) for frame in frames])
+            return self._render_half_blocks(pixels, use_color)
+
+        aspect_ratio = frames.shape[1] / frames.shape[2]
+        height = int(self.width * aspect_ratio * 0.55)
+        pixels = np.stack(
+            [np.asarray(Image.fromarray(frame).resize((self.width, height))) for frame in frames]
+        )
+        return self._render_batch(pixels, use_color)
+
+    def _render_batch(self, pixels: np.ndarray, use_color: bool) -> List[str]:
+        """
+        Render an (N, height, width, 3) stack of resized RGB pixels.
+
+        Args:
+            pixels: Resized RGB pixels
+            use_color: Whether to use ANSI color codes
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
         # Convert to grayscale for brightness calculation
-        gray = np.dot(pixels[..., :3], [0.299, 0.587, 0.114])
+        gray = self.kernels.luma(pixels)
 
         # Normalize to character range
-        normalized = (gray / 255 * (len(self.chars) - 1)).astype(int)
+        normalized = self.kernels.quantize(gray, len(self.chars))
+
+        if use_color:
+            return self.kernels.color_encode(pixels, normalized, self.chars)
+        return self.kernels.glyph_map(normalized, self.chars)
+
+    def _half_block_pixels(self, img: Image.Image) -> np.ndarray:
+        """
+        Resize a PIL Image to two pixel rows per character cell.
+
+        By default the cell grid matches the glyph renderer, so the picture
+        keeps its shape with twice the vertical resolution (and more bytes per
+        cell). With ``compact`` the glyph renderer's pixel rows are packed two
+        per cell: the same samples in half the cells and far fewer bytes, but
+        the picture is drawn half as tall.
+        """
+        aspect_ratio = img.height / img.width
+        height = int(self.width * aspect_ratio * 0.55)  # Glyph renderer rows
+        cells = (height + 1) // 2 if self.compact else height
+
+        img = img.resize((self.width, max(1, cells) * 2))
 
-        lines = []
-        for row_idx in range(height):
-            line_chars = []
-            for col_idx in range(self.width):
-                char = self.chars[normalized[row_idx, col_idx]]
+        if img.mode != "RGB":
+            img = img.convert("RGB")
 
-                if use_color:
-                    r, g, b = pixels[row_idx, col_idx][:3]
-                    # Use ANSI 24-bit color
-                    line_chars.append(f"\033[38;2;{r};{g};{b}m{char}\033[0m")
-                else:
-                    line_chars.append(char)
+        return np.array(img)
+
+    def _render_half_blocks(self, pixels: np.ndarray, use_color: bool) -> List[str]:
+        """
+        Render an (N, 2 * height, width, 3) stack using half blocks.
+
+        In color mode each cell is a ``▀`` whose foreground is the top pixel and
+        whose background is the bottom pixel, with colors inverted when
+        ``invert`` is set. Escape codes are only emitted when a color changes
+        from the previous cell in the row. Without color, each pixel is
+        thresholded and the cell picks its glyph from the style's `` ▀▄█``.
+
+        Args:
+            pixels: Resized RGB pixels
+            use_color: Whether to use ANSI color codes
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
+        if not use_color:
+            # Glyphs are indexed by (top lit) + 2 * (bottom lit); the inverted
+            # character set is the same table with both halves flipped
+            lit = self.kernels.luma(pixels) >= 128
+            codes = lit[:, 0::2].astype(np.int64) + 2 * lit[:, 1::2]
+            return self.kernels.glyph_map(codes, self.chars)
 
-            lines.append("".join(line_chars))
+        if self.invert:
+            pixels = 255 - pixels
 
-        return "\n".join(lines)
+        return self.kernels.half_block_encode(pixels[:, 0::2], pixels[:, 1::2])
 
     def video_frame_to_ascii(self, frame: np.ndarray, use_color: bool = False) -> str:
         """
@@ -0,0 +1,110 @@
+"""
+Row-interned frame storage for ASCII Cinema animations
+"""
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Row = Union[str, bytes]
+
+
+class FrameStore:
+    """Stores frames as tuples of references into a shared table of rows.
+
+    Consecutive frames of screen recordings and many GIFs differ in only a
+    few rows, so each distinct row is kept once no matter how many frames
+    use it.
+    """
+
+    def __init__(self, encode: bool = False):
+        """
+        Initialize an empty store.
+
+        Args:
+            encode: Whether to keep rows as UTF-8 bytes ready for raw output
+        """
+        self.encode = encode
+        self.rows: List[Row] = []
+        self._row_ids: Dict[Row, int] = {}
+        self._frames: List[Tuple[int, ...]] = []
+
+    def __len__(self) -> int:
+        """Return the number of frames."""
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> str:
+        """Rebuild the full text of a frame."""
+        rows = (self.rows[row_id] for row_id in self._frames[index])
+        return "\n".join(row.decode() if isinstance(row, bytes) else row for row in rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the row table, references and lookup index."""
+        size = sys.getsizeof(self.rows) + sys.getsizeof(self._row_ids)
+        size += sys.getsizeof(self._frames)
+        size += sum(sys.getsizeof(row) for row in self.rows)
+        size += sum(sys.getsizeof(refs) for refs in self._frames)
+        return size
+
+    def append(self, frame: str) -> None:
+        """
+        Add a frame, interning each of its rows.
+
+        Args:
+            frame: ASCII art string
+        """
+        self._frames.append(
+            tuple(
+                self._intern(line.encode() if self.encode else line)
+                for line in frame.split("\n")
+            )
+        )
+
+    def extend(self, frames: Iterable[str]) -> None:
+        """Add several frames in order."""
+        for frame in frames:
+            self.append(frame)
+
+    def merge(self, other: "FrameStore") -> None:
+        """
+        Add every frame of another store in order, sharing rows with this one.
+
+        Args:
+            other: Store built with the same encode setting
+        """
+        if other.encode != self.encode:
+            raise ValueError("Cannot merge frame stores with different row encodings")
+
+        row_ids = [self._intern(row) for row in other.rows]
+        self._frames.extend(tuple(row_ids[ref] for ref in refs) for refs in other._frames)
+
+    def _intern(self, row: Row) -> int:
+        """Return the id of a row, adding it to the table if it is new."""
+        row_id = self._row_ids.get(row)
+        if row_id is None:
+            row_id = len(self.rows)
+            self.rows.append(row)
+            self._row_ids[row] = row_id
+        return row_id
+
+    def refs(self, index: int) -> Tuple[int, ...]:
+        """Return the row references that make up a frame."""
+        return self._frames[index]
+
+    def changed_rows(self, previous: Optional[int], index: int) -> List[Tuple[int, Row]]:
+        """
+        List the rows that differ between two frames.
+
+        Args:
+            previous: Index of the frame currently on screen (None = nothing)
+            index: Index of the frame about to be drawn
+
+        Returns:
+            List of (line number, row) pairs that need redrawing
+        """
+        refs = self._frames[index]
+        old = self._frames[previous] if previous is not None else ()
+        return [
+            (line, self.rows[row_id])
+            for line, row_id in enumerate(refs)
+            if line >= len(old) or old[line] != row_id
+        ]
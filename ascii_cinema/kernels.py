@@ -0,0 +1,262 @@
+"""
+Conversion kernel backends for ASCII Cinema
+"""
+import importlib
+from enum import Enum
+from types import ModuleType
+from typing import List, Tuple
+
+import numpy as np
+
+# ASCII digits for every channel value, NUL-padded to three bytes
+_CHANNEL_DIGITS = np.frombuffer(
+    b"".join(str(value).encode().ljust(3, b"\0") for value in range(256)), dtype=np.uint8
+).reshape(256, 3)
+
+# Byte layout of one colored cell before the NUL padding is dropped
+_COLOR_PREFIX = np.frombuffer(b"\033[38;2;", dtype=np.uint8)
+_COLOR_RESET = np.frombuffer(b"\033[0m", dtype=np.uint8)
+_CELL_BYTES = 27
+
+# Byte layout of one half-block cell: ESC [ fg ; bg m ▀, where the
+# foreground and background parts are dropped when their color repeats
+_FG_PARAMS = np.frombuffer(b"38;2;", dtype=np.uint8)
+_BG_PARAMS = np.frombuffer(b"48;2;", dtype=np.uint8)
+_HALF_BLOCK = np.frombuffer("▀".encode(), dtype=np.uint8)
+_HALF_BLOCK_CELL_BYTES = 39
+_ROW_END = np.frombuffer(b"\033[0m\n", dtype=np.uint8)
+
+
+class KernelBackend(str, Enum):
+    """Available implementations of the conversion kernels."""
+
+    AUTO = "auto"
+    NUMPY = "numpy"
+    NUMBA = "numba"
+
+    def __str__(self) -> str:
+        """Return the enum name for CLI display."""
+        return self.name.lower()
+
+
+class NumpyKernels:
+    """Reference kernels built from vectorized NumPy operations.
+
+    Every other backend must produce exactly the same output as this one.
+    """
+
+    name = "numpy"
+
+    def luma(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        Compute brightness for a stack of frames.
+
+        Args:
+            pixels: (N, height, width, 3) RGB uint8 array
+
+        Returns:
+            (N, height, width) float64 array in the range 0-255
+        """
+        return pixels[..., 0] * 0.299 + pixels[..., 1] * 0.587 + pixels[..., 2] * 0.114
+
+    def quantize(self, gray: np.ndarray, levels: int) -> np.ndarray:
+        """
+        Map brightness to glyph indices.
+
+        Args:
+            gray: Brightness from luma()
+            levels: Number of glyphs in the character set
+
+        Returns:
+            Integer array of glyph indices, same shape as gray
+        """
+        return (gray / 255 * (levels - 1)).astype(np.int64)
+
+    def glyph_map(self, indices: np.ndarray, chars: str) -> List[str]:
+        """
+        Render glyph indices as plain text frames.
+
+        Args:
+            indices: (N, height, width) glyph indices
+            chars: Character set the indices refer to
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
+        # Fixed-width glyph cells plus a newline column, decoded a frame at a time
+        count, height, width = indices.shape
+        cells = np.empty((count, height, width + 1), dtype="<U1")
+        cells[..., :-1] = np.array(list(chars))[indices]
+        cells[..., -1] = "\n"
+        return [frame.tobytes().decode("utf-32-le")[:-1] for frame in cells]
+
+    def color_encode(self, pixels: np.ndarray, indices: np.ndarray, chars: str) -> List[str]:
+        """
+        Render glyph indices with a 24-bit ANSI color per cell.
+
+        Args:
+            pixels: (N, height, width, 3) RGB uint8 array
+            indices: (N, height, width) glyph indices
+            chars: Character set the indices refer to
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
+        # Every cell gets a fixed-width, NUL-padded byte layout; dropping the
+        # padding with one mask leaves the variable-length escape codes
+        count, height, width = indices.shape
+        glyph_bytes, _ = _glyph_table(chars)
+        rows = np.zeros((count, height, width * _CELL_BYTES + 1), dtype=np.uint8)
+        cells = rows[..., :-1].reshape(count, height, width, _CELL_BYTES)
+        cells[..., 0:7] = _COLOR_PREFIX
+        cells[..., 7:10] = _CHANNEL_DIGITS[pixels[..., 0]]
+        cells[..., 10] = ord(";")
+        cells[..., 11:14] = _CHANNEL_DIGITS[pixels[..., 1]]
+        cells[..., 14] = ord(";")
+        cells[..., 15:18] = _CHANNEL_DIGITS[pixels[..., 2]]
+        cells[..., 18] = ord("m")
+        cells[..., 19:23] = glyph_bytes[indices]
+        cells[..., 23:27] = _COLOR_RESET
+        rows[..., -1] = ord("\n")
+
+        return _drop_padding(rows)
+
+    def half_block_encode(self, top: np.ndarray, bottom: np.ndarray) -> List[str]:
+        """
+        Render ``▀`` cells colored by a top and a bottom pixel.
+
+        A color code is only written when the foreground or background
+        differs from the previous cell in the row.
+
+        Args:
+            top: (N, height, width, 3) RGB uint8 foreground pixels
+            bottom: (N, height, width, 3) RGB uint8 background pixels
+
+        Returns:
+            List of ASCII art strings, one per frame
+        """
+        count, height, width, _ = top.shape
+        fg_changed = np.ones((count, height, width), dtype=bool)
+        bg_changed = np.ones((count, height, width), dtype=bool)
+        fg_changed[..., 1:] = np.any(top[:, :, 1:] != top[:, :, :-1], axis=-1)
+        bg_changed[..., 1:] = np.any(bottom[:, :, 1:] != bottom[:, :, :-1], axis=-1)
+
+        rows = np.zeros(
+            (count, height, width * _HALF_BLOCK_CELL_BYTES + len(_ROW_END)), dtype=np.uint8
+        )
+        cells = rows[..., : -len(_ROW_END)].reshape(
+            count, height, width, _HALF_BLOCK_CELL_BYTES
+        )
+        cells[..., 0:2] = _COLOR_PREFIX[:2]
+        for offset, params, pixels in ((2, _FG_PARAMS, top), (19, _BG_PARAMS, bottom)):
+            cells[..., offset : offset + 5] = params
+            for channel in range(3):
+                start = offset + 5 + 4 * channel
+                cells[..., start : start + 3] = _CHANNEL_DIGITS[pixels[..., channel]]
+                if channel < 2:
+                    cells[..., start + 3] = ord(";")
+        cells[..., 18] = ord(";")
+        cells[..., 35] = ord("m")
+        cells[..., 36:39] = _HALF_BLOCK
+        rows[..., -len(_ROW_END) :] = _ROW_END
+
+        # Blank out the parts of each escape code that are not needed
+        cells[..., 0:2] *= (fg_changed | bg_changed)[..., None]
+        cells[..., 2:18] *= fg_changed[..., None]
+        cells[..., 18] *= fg_changed & bg_changed
+        cells[..., 19:35] *= bg_changed[..., None]
+        cells[..., 35] *= fg_changed | bg_changed
+
+        return _drop_padding(rows)
+
+
+class NumbaKernels(NumpyKernels):
+    """Kernels compiled with Numba that write UTF-8 straight into byte buffers."""
+
+    name = "numba"
+
+    def __init__(self) -> None:
+        """Check that the compiled kernels can be loaded (requires numba)."""
+        _jit()
+
+    def luma(self, pixels: np.ndarray) -> np.ndarray:
+        return _jit().luma(np.ascontiguousarray(pixels))  # type: ignore[no-any-return]
+
+    def quantize(self, gray: np.ndarray, levels: int) -> np.ndarray:
+        return _jit().quantize(gray, levels)  # type: ignore[no-any-return]
+
+    def glyph_map(self, indices: np.ndarray, chars: str) -> List[str]:
+        glyph_bytes, glyph_lengths = _glyph_table(chars)
+        buffer, offsets = _jit().glyph_map(indices, glyph_bytes, glyph_lengths)
+        return _split_frames(buffer, offsets)
+
+    def color_encode(self, pixels: np.ndarray, indices: np.ndarray, chars: str) -> List[str]:
+        glyph_bytes, glyph_lengths = _glyph_table(chars)
+        buffer, offsets = _jit().color_encode(
+            np.ascontiguousarray(pixels), indices, glyph_bytes, glyph_lengths
+        )
+        return _split_frames(buffer, offsets)
+
+
+def _jit() -> ModuleType:
+    """Import the compiled kernels on first use."""
+    try:
+        return importlib.import_module("ascii_cinema._numba_kernels")
+    except ImportError:
+        raise ImportError(
+            "numba is required for the numba backend. "
+            "Install it with: pip install numba"
+        ) from None
+
+
+def _glyph_table(chars: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return each glyph's UTF-8 bytes as rows of a padded uint8 table."""
+    encoded = [char.encode() for char in chars]
+    table = np.zeros((len(encoded), 4), dtype=np.uint8)
+    for i, glyph in enumerate(encoded):
+        table[i, : len(glyph)] = list(glyph)
+    return table, np.array([len(glyph) for glyph in encoded], dtype=np.int64)
+
+
+def _drop_padding(rows: np.ndarray) -> List[str]:
+    """Decode (N, height, bytes) NUL-padded rows that each end in a newline."""
+    rows = rows.reshape(len(rows), -1)
+    keep = rows != 0
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum(keep.sum(axis=1), out=offsets[1:])
+    data = rows[keep].tobytes()
+    # Drop each frame's trailing newline
+    return [
+        data[offsets[i] : max(offsets[i], offsets[i + 1] - 1)].decode()
+        for i in range(len(rows))
+    ]
+
+
+def _split_frames(buffer: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """Decode a buffer holding several frames back to back."""
+    data = buffer.tobytes()
+    return [
+        data[offsets[i] : offsets[i + 1]].decode() for i in range(len(offsets) - 1)
+    ]
+
+
+def load_kernels(backend: KernelBackend = KernelBackend.AUTO) -> NumpyKernels:
+    """
+    Create the kernels for a backend.
+
+    Args:
+        backend: Backend to use; AUTO picks Numba when it is installed
+
+    Returns:
+        Kernel object used by ASCIIConverter
+    """
+    backend = KernelBackend(backend)
+    if backend is KernelBackend.NUMPY:
+        return NumpyKernels()
+    if backend is KernelBackend.NUMBA:
+        return NumbaKernels()
+
+    try:
+        return NumbaKernels()
+    except ImportError:
+        return NumpyKernels()
@@ -1,30 +1,132 @@
 """
 Video and animation playback for ASCII Cinema
 """
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Union
 
+import numpy as np
 from PIL import Image
 from rich.console import Console
 from rich.live import Live
 
 from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.frames import FrameStore
+from ascii_cinema.terminal import DisplayBackend, RawTerminal
+
+# Number of frames converted together when preloading; benchmarks/bench_batch.py
+# shows no gain past a few frames, so keep the batch small to bound memory
+BATCH_SIZE = 4
+
+
+def _convert_segment(
+    video_path: str,
+    start: int,
+    stop: Optional[int],
+    converter: ASCIIConverter,
+    use_color: bool,
+    encode: bool,
+) -> FrameStore:
+    """Decode and convert frames [start, stop) using a capture handle of its own.
+
+    Frames are interned batch by batch, so only BATCH_SIZE rendered frames
+    exist as full strings at any time.
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video file: {video_path}")
+
+    try:
+        if start:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+        frames = FrameStore(encode=encode)
+        batch: List[np.ndarray] = []
+        index = start
+        while stop is None or index < stop:
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            # Convert BGR to RGB
+            batch.append(frame[:, :, ::-1])
+            if len(batch) == BATCH_SIZE:
+                frames.extend(converter.frames_to_ascii(np.stack(batch), use_color))
+                batch.clear()
+            index += 1
+
+        if batch:
+            frames.extend(converter.frames_to_ascii(np.stack(batch), use_color))
+
+        return frames
+
+    finally:
+        cap.release()
 
 
 class ASCIIPlayer:
     """Plays ASCII art animations."""
 
-    def __init__(self, converter: ASCIIConverter, console: Console):
+    def __init__(
+        self,
+        converter: ASCIIConverter,
+        console: Console,
+        display: DisplayBackend = DisplayBackend.RICH,
+    ):
         """
         Initialize the player.
 
         Args:
             converter: ASCIIConverter instance
             console: Rich Console instance
+            display: How frames are written to the terminal
         """
         self.converter = converter
         self.console = console
+        self.display = display
+        # Most recently preloaded animation
+        self.frames: Optional[FrameStore] = None
+
+    def _open_display(self, fps: float) -> Union[Live, RawTerminal]:
+        """Create the context manager that frames are drawn through."""
+        if self.display is DisplayBackend.RAW:
+            terminal = RawTerminal()
+            if self.converter.width > terminal.columns:
+                self.console.print(
+                    f"[yellow]Warning: frames are {self.converter.width} columns wide but "
+                    f"the terminal has {terminal.columns}; the right edge will be cut off[/yellow]"
+                )
+            return terminal
+        return Live(console=self.console, refresh_per_second=fps)
+
+    def _new_frame_store(self) -> FrameStore:
+        """Create a frame store whose rows suit the selected display backend."""
+        return FrameStore(encode=self.display is DisplayBackend.RAW)
+
+    def _play_frames(self, frames: FrameStore, fps: float, loop: bool) -> None:
+        """Play stored frames, redrawing only changed rows on the raw display."""
+        frame_delay = 1.0 / fps
+
+        with self._open_display(fps) as live:
+            previous = None
+            while True:
+                for index in range(len(frames)):
+                    if isinstance(live, RawTerminal):
+                        rows = frames.changed_rows(previous, index)
+                        live.update(RawTerminal.encode_rows(rows, live.lines))
+                    else:
+                        live.update(frames[index])
+                    previous = index
+                    time.sleep(frame_delay)
+                
+                if not loop:
+                    break
 
     def play_video(
         self,
@@ -32,6 +134,8 @@ class ASCIIPlayer:
         use_color: bool = False,
         target_fps: Optional[float] = None,
         loop: bool = True,
+        segments: int = 1,
+        on_loaded: Optional[Callable[[], None]] = None,
     ) -> None:
         """
         Play a video or GIF as ASCII animation.
@@ -41,12 +145,14 @@ class ASCIIPlayer:
             use_color: Whether to use colored output
             target_fps: Target frames per second (None = source fps)
             loop: Whether to loop the animation
+            segments: Number of chunks to decode video files in parallel
+            on_loaded: Called once every frame is converted, just before playback
         """
         # Check if it's a GIF
         if video_path.suffix.lower() in [".gif"]:
-            self._play_gif(video_path, use_color, target_fps, loop)
+            self._play_gif(video_path, use_color, target_fps, loop, on_loaded)
         else:
-            self._play_video_file(video_path, use_color, target_fps, loop)
+            self._play_video_file(video_path, use_color, target_fps, loop, segments, on_loaded)
 
     def _play_gif(
         self,
@@ -54,6 +160,7 @@ class ASCIIPlayer:
         use_color: bool = False,
         target_fps: Optional[float] = None,
         loop: bool = True,
+        on_loaded: Optional[Callable[[], None]] = None,
     ) -> None:
         """Play a GIF file as ASCII animation."""
         img = Image.open(gif_path)
@@ -66,32 +173,32 @@ class ASCIIPlayer:
             source_fps = 10.0
 
         fps = target_fps if target_fps else source_fps
-        frame_delay = 1.0 / fps
 
-        frames = []
+        frames = self._new_frame_store()
+        batch: List[np.ndarray] = []
         try:
             while True:
-                # Convert current frame
-                frame_copy = img.copy().convert("RGB")
-                ascii_frame = self.converter._convert_image(frame_copy, use_color)
-                frames.append(ascii_frame)
+                # Queue current frame for conversion
+                batch.append(np.asarray(img.convert("RGB")))
+                if len(batch) == BATCH_SIZE:
+                    frames.extend(self.converter.frames_to_ascii(np.stack(batch), use_color))
+                    batch.clear()
                 
                 img.seek(img.tell() + 1)
         except EOFError:
             pass  # End of GIF
 
+        if batch:
+            frames.extend(self.converter.frames_to_ascii(np.stack(batch), use_color))
+
         if not frames:
             raise ValueError("No frames found in GIF")
 
         # Play the animation
-        with Live(frames[0], console=self.console, refresh_per_second=fps) as live:
-            while True:
-                for frame in frames:
-                    live.update(frame)
-                    time.sleep(frame_delay)
-                
-                if not loop:
-                    break
+        self.frames = frames
+        if on_loaded is not None:
+            on_loaded()
+        self._play_frames(frames, fps, loop)
 
     def _play_video_file(
         self,
@@ -99,6 +206,8 @@ class ASCIIPlayer:
         use_color: bool = False,
         target_fps: Optional[float] = None,
         loop: bool = True,
+        segments: int = 1,
+        on_loaded: Optional[Callable[[], None]] = None,
     ) -> None:
         """Play a video file as ASCII animation (requires opencv-python)."""
         try:
@@ -116,35 +225,93 @@ class ASCIIPlayer:
 
         # Get video properties
         source_fps = cap.get(cv2.CAP_PROP_FPS)
+        cap.release()
         fps = target_fps if target_fps else source_fps
-        frame_delay = 1.0 / fps
 
+        # Pre-load frames for smooth playback
+        frames = self.convert_video(video_path, use_color, segments)
+
+        if not frames:
+            raise ValueError("No frames found in video")
+
+        # Play the animation
+        self.frames = frames
+        if on_loaded is not None:
+            on_loaded()
+        self._play_frames(frames, fps, loop)
+
+    def convert_video(
+        self, video_path: Path, use_color: bool = False, segments: int = 1
+    ) -> FrameStore:
+        """
+        Convert every frame of a video file to ASCII art.
+
+        With more than one segment the frame range is split into equal chunks
+        that are decoded and converted in separate processes, each with its
+        own capture handle. Each chunk comes back already interned and is
+        merged into the result in order. At most one worker runs per CPU.
+
+        Workers are started with the spawn method, which re-imports the
+        calling script, so scripts that use more than one segment must call
+        this under an ``if __name__ == "__main__":`` guard; code run from
+        stdin or an unguarded script fails with BrokenProcessPool.
+
+        Args:
+            video_path: Path to video file
+            use_color: Whether to use colored output
+            segments: Number of chunks to decode in parallel
+
+        Returns:
+            Frame store holding the frames in playback order
+        """
         try:
-            # Pre-load frames for smooth playback
-            frames = []
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                ascii_frame = self.converter.video_frame_to_ascii(frame, use_color)
-                frames.append(ascii_frame)
+            import cv2
+        except ImportError:
+            raise ImportError(
+                "opencv-python is required for video playback. "
+                "Install it with: pip install opencv-python"
+            ) from None
 
-            if not frames:
-                raise ValueError("No frames found in video")
+        cap = cv2.VideoCapture(str(video_path))
 
-            # Play the animation
-            with Live(frames[0], console=self.console, refresh_per_second=fps) as live:
-                while True:
-                    for frame in frames:
-                        live.update(frame)
-                        time.sleep(frame_delay)
-                    
-                    if not loop:
-                        break
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video file: {video_path}")
 
-        finally:
-            cap.release()
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+
+        # Fall back to a single pass when the count is unknown or too small to split
+        encode = self.display is DisplayBackend.RAW
+        segments = min(segments, frame_count)
+        if segments <= 1:
+            return _convert_segment(
+                str(video_path), 0, None, self.converter, use_color, encode
+            )
+
+        bounds = [frame_count * i // segments for i in range(segments + 1)]
+        # Spawn rather than fork: the CLI's progress spinner runs a thread
+        # that a forked child could inherit mid-write
+        context = multiprocessing.get_context("spawn")
+        workers = min(segments, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(
+                    _convert_segment,
+                    str(video_path),
+                    bounds[i],
+                    # The last chunk reads to the end in case the count was low
+                    bounds[i + 1] if i < segments - 1 else None,
+                    self.converter,
+                    use_color,
+                    encode,
+                )
+                for i in range(segments)
+            ]
+            frames = self._new_frame_store()
+            for future in futures:
+                frames.merge(future.result())
+
+        return frames
 
     def play_webcam(self, use_color: bool = False, fps: float = 15.0) -> None:
         """
@@ -177,7 +344,8 @@ class ASCIIPlayer:
 
             ascii_frame = self.converter.video_frame_to_ascii(frame, use_color)
 
-            with Live(ascii_frame, console=self.console, refresh_per_second=fps) as live:
+            with self._open_display(fps) as live:
+                live.update(ascii_frame)
                 while True:
                     ret, frame = cap.read()
                     if not ret:
@@ -0,0 +1,143 @@
+"""
+Memory profiling for ASCII Cinema
+"""
+import sys
+import tracemalloc
+from types import TracebackType
+from typing import List, Optional, Type
+
+import numpy as np
+
+from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.frames import FrameStore
+
+# Allocations made while importing modules, which say nothing about frames
+_IMPORT_FILES = ("<frozen importlib._bootstrap*>", "<frozen abc>")
+
+
+def peak_rss(children: bool = False) -> int:
+    """
+    Return the peak resident set size in bytes.
+
+    Args:
+        children: Report the largest finished child process instead of this one
+
+    Returns:
+        Peak RSS in bytes, or 0 where the platform does not report it
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def warm_up(converter: ASCIIConverter, use_color: bool = False) -> None:
+    """
+    Import lazily loaded libraries and compile the kernels ahead of tracing.
+
+    OpenCV and the Numba kernels are otherwise loaded on first use, so their
+    import and compilation would dominate the traced peak and top allocators.
+
+    Args:
+        converter: Converter whose kernels should be loaded
+        use_color: Whether to load the colored output kernels
+    """
+    try:
+        import cv2  # noqa: F401
+    except ImportError:
+        pass
+
+    converter.frames_to_ascii(np.zeros((1, 2, 2, 3), dtype=np.uint8), use_color)
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class MemoryProfiler:
+    """Records peak memory and the top Python allocators while a command runs."""
+
+    def __init__(self, top: int = 10):
+        """
+        Initialize the profiler.
+
+        Args:
+            top: Number of allocation sites to report
+        """
+        self.top = top
+        self.traced_peak = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def __enter__(self) -> "MemoryProfiler":
+        """Start tracing allocations."""
+        tracemalloc.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Stop tracing, keeping the peak and a snapshot even on Ctrl+C."""
+        self.traced_peak = tracemalloc.get_traced_memory()[1]
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+            + [tracemalloc.Filter(False, pattern) for pattern in _IMPORT_FILES]
+        )
+        tracemalloc.stop()
+
+    def top_allocators(self) -> List[tracemalloc.Statistic]:
+        """Return the allocation sites holding the most memory at exit."""
+        if self.snapshot is None:
+            return []
+        return self.snapshot.statistics("lineno")[: self.top]
+
+    def report(self, frames: Optional[FrameStore] = None) -> str:
+        """
+        Build a plain text memory report.
+
+        Args:
+            frames: Cached frames to account for, if any
+
+        Returns:
+            Multi-line report
+        """
+        lines = [
+            "Memory profile",
+            f"  peak RSS:           {format_bytes(peak_rss())}",
+        ]
+        children = peak_rss(children=True)
+        if children:
+            # Any finished child process counts, not only segment workers
+            lines.append(f"  child peak RSS:     {format_bytes(children)}")
+        lines.append(f"  traced peak:        {format_bytes(self.traced_peak)}")
+
+        if frames:
+            lines += [
+                f"  cached frames:      {len(frames)} ({len(frames.rows)} unique rows)",
+                f"  frame cache:        {format_bytes(frames.nbytes)}",
+                f"  bytes per frame:    {format_bytes(frames.nbytes / len(frames))}",
+            ]
+        else:
+            lines.append("  cached frames:      0")
+
+        lines.append(f"Top {self.top} allocators")
+        for stat in self.top_allocators():
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {format_bytes(stat.size):>12} in {stat.count:>6} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+
+        return "\n".join(lines)
@@ -13,6 +13,7 @@ class ASCIIStyle(str, Enum):
     BLOCKS = " ░▒▓█"
     BINARY = " █"
     MINIMAL = " .:-=#"
+    HALF_BLOCKS = " ▀▄█"
 
     def __str__(self) -> str:
         """Return the enum name for CLI display."""
@@ -0,0 +1,137 @@
+"""
+Raw terminal output for ASCII Cinema
+"""
+import shutil
+import sys
+from enum import Enum
+from types import TracebackType
+from typing import BinaryIO, Iterable, Optional, Tuple, Type, Union
+
+# DEC private modes and cursor control
+ALT_SCREEN_ON = "\033[?1049h"
+ALT_SCREEN_OFF = "\033[?1049l"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+CLEAR_SCREEN = "\033[2J"
+CURSOR_HOME = "\033[H"
+AUTOWRAP_OFF = "\033[?7l"
+AUTOWRAP_ON = "\033[?7h"
+SYNC_BEGIN = "\033[?2026h"
+SYNC_END = "\033[?2026l"
+
+
+class DisplayBackend(str, Enum):
+    """Available ways of putting frames on the terminal."""
+
+    RICH = "rich"
+    RAW = "raw"
+
+    def __str__(self) -> str:
+        """Return the enum name for CLI display."""
+        return self.name.lower()
+
+
+class RawTerminal:
+    """Writes pre-encoded frames straight to the terminal, bypassing Rich."""
+
+    def __init__(
+        self,
+        stream: Optional[BinaryIO] = None,
+        lines: Optional[int] = None,
+        columns: Optional[int] = None,
+    ):
+        """
+        Initialize the terminal.
+
+        Args:
+            stream: Binary stream to write to (defaults to stdout)
+            lines: Number of rows that fit on screen (defaults to the terminal height)
+            columns: Number of cells per row (defaults to the terminal width)
+        """
+        size = shutil.get_terminal_size()
+        self.stream = stream if stream is not None else sys.stdout.buffer
+        self.lines = lines if lines is not None else size.lines
+        self.columns = columns if columns is not None else size.columns
+        self._active = False
+
+    @staticmethod
+    def encode(frame: str, lines: Optional[int] = None) -> bytes:
+        """
+        Encode a frame as a single synchronized terminal update.
+
+        Args:
+            frame: ASCII art string
+            lines: Drop rows past this many so the screen never scrolls
+
+        Returns:
+            Bytes ready to be written to the terminal
+        """
+        if lines is not None:
+            frame = "\n".join(frame.split("\n")[:lines])
+        return f"{SYNC_BEGIN}{CURSOR_HOME}{frame}{SYNC_END}".encode()
+
+    @staticmethod
+    def encode_rows(
+        rows: Iterable[Tuple[int, Union[str, bytes]]], lines: Optional[int] = None
+    ) -> bytes:
+        """
+        Encode a synchronized update that redraws only the given rows.
+
+        Args:
+            rows: (line number, row) pairs, line numbers counted from 0
+            lines: Skip rows past this many, which would land on the last line
+
+        Returns:
+            Bytes ready to be written to the terminal
+        """
+        parts = [SYNC_BEGIN.encode()]
+        for line, row in rows:
+            if lines is not None and line >= lines:
+                continue
+            parts.append(b"\033[%d;1H" % (line + 1))
+            parts.append(row if isinstance(row, bytes) else row.encode())
+        parts.append(SYNC_END.encode())
+        return b"".join(parts)
+
+    def update(self, frame: Union[str, bytes]) -> None:
+        """
+        Draw a frame with a single write.
+
+        Args:
+            frame: ASCII art string, clipped to the screen, or bytes from encode()
+        """
+        data = frame if isinstance(frame, bytes) else self.encode(frame, self.lines)
+        self.stream.write(data)
+        self.stream.flush()
+
+    def __enter__(self) -> "RawTerminal":
+        """
+        Switch to the alternate screen, hide the cursor and stop line wrapping.
+
+        With autowrap off, rows wider than the terminal are cut off at the
+        right edge instead of wrapping onto the rows below them.
+        """
+        self._write(f"{ALT_SCREEN_ON}{HIDE_CURSOR}{CLEAR_SCREEN}{AUTOWRAP_OFF}")
+        self._active = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Restore the cursor and the main screen, even on Ctrl+C."""
+        self.restore()
+
+    def restore(self) -> None:
+        """Restore the terminal state if it was changed."""
+        if not self._active:
+            return
+        self._active = False
+        # End any half-written synchronized update before leaving
+        self._write(f"{SYNC_END}\033[0m{AUTOWRAP_ON}{SHOW_CURSOR}{ALT_SCREEN_OFF}")
+
+    def _write(self, text: str) -> None:
+        self.stream.write(text.encode())
+        self.stream.flush()
@@ -0,0 +1,63 @@
+"""
+Benchmark batched frame conversion against frame-at-a-time conversion.
+
+Usage:
+    python -m benchmarks.bench_batch [--width 100] [--frames 128] [--backend auto]
+"""
+import argparse
+import time
+
+import numpy as np
+from PIL import Image
+
+from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.kernels import KernelBackend
+from ascii_cinema.styles import ASCIIStyle
+
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64]
+
+
+def bench_single(converter: ASCIIConverter, frames: np.ndarray, use_color: bool) -> float:
+    """Return frames per second converting one frame per call."""
+    start = time.perf_counter()
+    for frame in frames:
+        converter._convert_image(Image.fromarray(frame), use_color)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def bench_batched(
+    converter: ASCIIConverter, frames: np.ndarray, use_color: bool, batch_size: int
+) -> float:
+    """Return frames per second converting batch_size frames per call."""
+    start = time.perf_counter()
+    for offset in range(0, len(frames), batch_size):
+        converter.frames_to_ascii(frames[offset : offset + batch_size], use_color)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=128)
+    parser.add_argument("--backend", type=KernelBackend, default=KernelBackend.AUTO)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 256, (args.frames, 240, 320, 3), dtype=np.uint8)
+    converter = ASCIIConverter(width=args.width, style=ASCIIStyle.STANDARD, backend=args.backend)
+    print(f"backend: {converter.kernels.name}")
+    # Warm up so one-off compilation is not timed
+    converter.frames_to_ascii(frames[:1], use_color=True)
+    converter.frames_to_ascii(frames[:1], use_color=False)
+
+    for use_color in (False, True):
+        label = "color" if use_color else "mono"
+        baseline = bench_single(converter, frames, use_color)
+        print(f"{label}: frame-at-a-time {baseline:8.1f} fps")
+        for batch_size in BATCH_SIZES:
+            fps = bench_batched(converter, frames, use_color, batch_size)
+            print(f"{label}: batch {batch_size:>2} {fps:8.1f} fps ({fps / baseline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
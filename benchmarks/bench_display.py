@@ -0,0 +1,76 @@
+"""
+Benchmark the Rich Live and raw terminal display backends.
+
+Both backends write to /dev/null so only the cost of getting a frame onto
+the stream is measured, not the terminal's own rendering.
+
+Usage:
+    python -m benchmarks.bench_display [--width 120] [--frames 200]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+from rich.console import Console
+from rich.live import Live
+
+from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.styles import ASCIIStyle
+from ascii_cinema.terminal import RawTerminal
+
+
+def make_frames(width: int, count: int, use_color: bool) -> list[str]:
+    """Convert random noise frames so every cell carries its own color."""
+    rng = np.random.default_rng(0)
+    converter = ASCIIConverter(width=width, style=ASCIIStyle.SIMPLE)
+    return [
+        converter.video_frame_to_ascii(
+            rng.integers(0, 256, (width * 3 // 4, width, 3), dtype=np.uint8), use_color
+        )
+        for _ in range(count)
+    ]
+
+
+def bench_rich(frames: list[str]) -> float:
+    """Return frames per second through Rich Live."""
+    with open(os.devnull, "w") as sink:
+        console = Console(file=sink, force_terminal=True, color_system="truecolor")
+        with Live(frames[0], console=console, auto_refresh=False) as live:
+            start = time.perf_counter()
+            for frame in frames:
+                live.update(frame, refresh=True)
+            elapsed = time.perf_counter() - start
+    return len(frames) / elapsed
+
+
+def bench_raw(frames: list[str]) -> float:
+    """Return frames per second through RawTerminal, including encoding."""
+    with open(os.devnull, "wb") as sink:
+        with RawTerminal(stream=sink) as terminal:
+            start = time.perf_counter()
+            for frame in frames:
+                terminal.update(RawTerminal.encode(frame))
+            elapsed = time.perf_counter() - start
+    return len(frames) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=120)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    for use_color in (False, True):
+        frames = make_frames(args.width, args.frames, use_color)
+        label = "color" if use_color else "mono"
+        rich_fps = bench_rich(frames)
+        raw_fps = bench_raw(frames)
+        print(
+            f"{label:>5}: rich {rich_fps:9.1f} fps | raw {raw_fps:9.1f} fps | "
+            f"speedup {raw_fps / rich_fps:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
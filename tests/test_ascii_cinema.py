@@ -1,17 +1,27 @@
 """
 Unit tests for ASCII Cinema
 """
+import io
+import os
+import sys
 import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 
 from ascii_cinema.converter import ASCIIConverter
+from ascii_cinema.frames import FrameStore
+from ascii_cinema.kernels import KernelBackend, NumpyKernels, load_kernels
 from ascii_cinema.player import ASCIIPlayer
+from ascii_cinema.profiling import MemoryProfiler, format_bytes, peak_rss, warm_up
 from ascii_cinema.styles import ASCIIStyle
+from ascii_cinema.terminal import DisplayBackend, RawTerminal
 
 
 class TestASCIIConverter:
@@ -102,6 +112,32 @@ class TestASCIIConverter:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    def test_frames_to_ascii_matches_single_frames(self):
+        """Test that batch conversion matches frame-at-a-time conversion."""
+        frames = np.random.randint(0, 255, (6, 30, 40, 3), dtype=np.uint8)
+        converter = ASCIIConverter(width=20, style=ASCIIStyle.STANDARD)
+
+        for use_color in (False, True):
+            expected = [
+                converter._convert_image(Image.fromarray(frame), use_color) for frame in frames
+            ]
+            assert converter.frames_to_ascii(frames, use_color) == expected
+
+    def test_frames_to_ascii_half_blocks(self):
+        """Test that batch conversion supports the half-block style."""
+        frames = np.random.randint(0, 255, (3, 10, 10, 3), dtype=np.uint8)
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.HALF_BLOCKS)
+
+        result = converter.frames_to_ascii(frames, use_color=True)
+        assert result == [
+            converter._convert_image(Image.fromarray(frame), True) for frame in frames
+        ]
+
+    def test_frames_to_ascii_empty(self):
+        """Test that an empty stack converts to no frames."""
+        converter = ASCIIConverter(width=10)
+        assert converter.frames_to_ascii(np.empty((0, 10, 10, 3), dtype=np.uint8)) == []
+
     def test_resize_for_terminal_wide_image(self):
         """Test terminal resize calculation for wide image."""
         img = Image.new("RGB", (200, 100))
@@ -137,6 +173,114 @@ class TestASCIIConverter:
         # Results should be different as they use different character sets
         assert simple_result != blocks_result
 
+    def test_half_blocks_packs_two_rows_per_cell(self):
+        """Test that half-block output uses one line per two pixel rows."""
+        img = Image.new("RGB", (10, 10))
+        for i in range(10):
+            img.putpixel((i, 0), (255, 255, 255))
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.HALF_BLOCKS)
+        result = converter._convert_image(img, use_color=False)
+
+        lines = result.split("\n")
+        # Same number of lines as the glyph renderer
+        assert len(lines) == int(10 * 1.0 * 0.55)
+        assert lines[0] == "▀" * 10
+        assert all(line == " " * 10 for line in lines[1:])
+
+    def test_half_blocks_monochrome_invert(self):
+        """Test that inversion flips which half is lit."""
+        img = Image.new("RGB", (4, 4), color=(0, 0, 0))
+        converter = ASCIIConverter(width=4, style=ASCIIStyle.HALF_BLOCKS, invert=True)
+        result = converter._convert_image(img, use_color=False)
+
+        assert set(result) <= {"█", "\n"}
+
+    def test_half_blocks_color_run_length(self):
+        """Test that color codes are only emitted when a color changes."""
+        img = Image.new("RGB", (8, 8), color=(10, 20, 30))
+        converter = ASCIIConverter(width=8, style=ASCIIStyle.HALF_BLOCKS)
+        result = converter._convert_image(img, use_color=True)
+
+        for line in result.split("\n"):
+            assert line == "\033[38;2;10;20;30;48;2;10;20;30m" + "▀" * 8 + "\033[0m"
+
+    def test_half_blocks_color_changes(self):
+        """Test that foreground and background change independently."""
+        img = Image.new("RGB", (2, 2), color=(0, 0, 0))
+        img.putpixel((1, 0), (255, 0, 0))
+        converter = ASCIIConverter(width=2, style=ASCIIStyle.HALF_BLOCKS)
+        lines = converter._convert_image(img, use_color=True).split("\n")
+
+        assert lines[0] == (
+            "\033[38;2;0;0;0;48;2;0;0;0m▀\033[38;2;255;0;0m▀\033[0m"
+        )
+
+    def test_half_blocks_color_invert(self):
+        """Test that invert flips the colors of both halves."""
+        img = Image.new("RGB", (1, 2), color=(10, 20, 30))
+        img.putpixel((0, 1), (255, 255, 255))
+        converter = ASCIIConverter(width=1, style=ASCIIStyle.HALF_BLOCKS, invert=True)
+        result = converter._convert_image(img, use_color=True)
+
+        assert result == "\033[38;2;245;235;225;48;2;0;0;0m▀\033[0m"
+
+    def test_half_blocks_style_reports_its_glyphs(self):
+        """Test that the style's character set is the one used for output."""
+        assert ASCIIConverter(style=ASCIIStyle.HALF_BLOCKS).chars == " ▀▄█"
+        inverted = ASCIIConverter(style=ASCIIStyle.HALF_BLOCKS, invert=True)
+        assert inverted.chars == "█▄▀ "
+
+    def test_half_blocks_compact_packs_glyph_rows(self):
+        """Test that compact mode puts two of the glyph renderer's rows in a cell."""
+        img = Image.new("RGB", (10, 10))
+        img.paste((255, 255, 255), (0, 0, 10, 1))
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.HALF_BLOCKS, compact=True)
+        lines = converter._convert_image(img, use_color=False).split("\n")
+
+        # The glyph renderer draws int(10 * 0.55) = 5 rows, rounded up to 3 cells
+        assert len(lines) == 3
+        assert lines[0] == "▀" * 10
+
+    @staticmethod
+    def gradient_image():
+        pixels = np.zeros((120, 160, 3), dtype=np.uint8)
+        pixels[..., 0] = np.linspace(0, 255, 160, dtype=np.uint8)
+        pixels[..., 1] = np.linspace(0, 255, 120, dtype=np.uint8)[:, np.newaxis]
+        return Image.fromarray(pixels)
+
+    @staticmethod
+    def flat_image():
+        img = Image.new("RGB", (160, 120), color=(30, 60, 200))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((40, 20, 120, 100), fill=(250, 200, 0))
+        draw.rectangle((0, 90, 160, 120), fill=(20, 160, 40))
+        return img
+
+    @pytest.mark.parametrize("image", ["gradient_image", "flat_image"])
+    def test_half_blocks_compact_saves_cells_and_bytes(self, image):
+        """Test compact half blocks against the glyph renderer at the same width."""
+        img = getattr(self, image)()
+        glyphs = ASCIIConverter(width=100)._convert_image(img, use_color=True)
+        compact = ASCIIConverter(width=100, style=ASCIIStyle.HALF_BLOCKS, compact=True)
+        blocks = compact._convert_image(img, use_color=True)
+
+        glyph_rows = glyphs.count("\n") + 1
+        assert blocks.count("\n") + 1 == (glyph_rows + 1) // 2
+        # About a fifth fewer bytes on a gradient, most of them on flat color
+        saving = 1 - len(blocks.encode()) / len(glyphs.encode())
+        assert saving > (0.15 if image == "gradient_image" else 0.8)
+
+    def test_half_blocks_trade_bytes_for_resolution_on_gradients(self):
+        """Test that the default grid doubles resolution at a cost in bytes."""
+        img = self.gradient_image()
+        glyphs = ASCIIConverter(width=100)._convert_image(img, use_color=True)
+        blocks = ASCIIConverter(width=100, style=ASCIIStyle.HALF_BLOCKS)._convert_image(
+            img, use_color=True
+        )
+
+        assert blocks.count("\n") == glyphs.count("\n")
+        assert len(blocks.encode()) > len(glyphs.encode())
+
 
 class TestASCIIPlayer:
     """Test suite for ASCIIPlayer class."""
@@ -230,6 +374,102 @@ class TestASCIIPlayer:
             finally:
                 tmp_path.unlink()
 
+    def test_play_gif_raw_display(self):
+        """Test playing a GIF through the raw terminal backend."""
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.SIMPLE)
+        console = Mock()
+        player = ASCIIPlayer(converter, console, display=DisplayBackend.RAW)
+        stream = io.BytesIO()
+
+        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as tmp:
+            img1 = Image.new("RGB", (10, 20), color=(255, 0, 0))
+            img2 = img1.copy()
+            img2.paste((0, 255, 0), (0, 10, 10, 20))
+            img1.save(tmp.name, save_all=True, append_images=[img2], duration=100)
+            tmp_path = Path(tmp.name)
+
+            try:
+                with patch("sys.stdout", Mock(buffer=stream)):
+                    with patch("shutil.get_terminal_size", return_value=os.terminal_size((80, 24))):
+                        with patch("ascii_cinema.player.Live") as mock_live:
+                            with patch("time.sleep"):
+                                player._play_gif(tmp_path, use_color=True, loop=False)
+
+                mock_live.assert_not_called()
+                output = stream.getvalue()
+                assert output.endswith(b"\033[?1049l")
+                updates = output.split(b"\033[?2026h")[1:]
+                assert len(updates) == 2
+                # The second frame only redraws the rows that changed
+                first_rows = updates[0].count(b";1H")
+                second_rows = updates[1].count(b";1H")
+                assert first_rows == 11
+                assert 0 < second_rows < first_rows
+
+            finally:
+                tmp_path.unlink()
+
+    @pytest.mark.parametrize("columns, warned", [(5, True), (10, False)])
+    def test_raw_display_warns_when_wider_than_terminal(self, columns, warned):
+        """Test that frames wider than the terminal are reported before playback."""
+        converter = ASCIIConverter(width=10)
+        console = Mock()
+        player = ASCIIPlayer(converter, console, display=DisplayBackend.RAW)
+
+        size = os.terminal_size((columns, 24))
+        with patch("sys.stdout", Mock(buffer=io.BytesIO())):
+            with patch("shutil.get_terminal_size", return_value=size):
+                terminal = player._open_display(10.0)
+
+        assert terminal.columns == columns
+        assert console.print.called is warned
+
+    def test_play_video_calls_on_loaded_before_playback(self):
+        """Test that the callback runs after preloading and before the first frame."""
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.SIMPLE)
+        player = ASCIIPlayer(converter, Mock())
+        events = []
+
+        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as tmp:
+            Image.new("RGB", (10, 10)).save(tmp.name)
+            tmp_path = Path(tmp.name)
+
+            try:
+                with patch.object(
+                    player, "_play_frames", side_effect=lambda *args: events.append("play")
+                ):
+                    player.play_video(
+                        tmp_path, loop=False, on_loaded=lambda: events.append(len(player.frames))
+                    )
+            finally:
+                tmp_path.unlink()
+
+        assert events == [1, "play"]
+
+    def test_play_gif_raw_display_clips_to_terminal(self):
+        """Test that raw playback never draws below the last terminal row."""
+        converter = ASCIIConverter(width=10, style=ASCIIStyle.SIMPLE)
+        player = ASCIIPlayer(converter, Mock(), display=DisplayBackend.RAW)
+        stream = io.BytesIO()
+        size = os.terminal_size((80, 4))
+
+        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as tmp:
+            Image.new("RGB", (10, 20), color=(255, 0, 0)).save(tmp.name)
+            tmp_path = Path(tmp.name)
+
+            try:
+                with patch("sys.stdout", Mock(buffer=stream)):
+                    with patch("shutil.get_terminal_size", return_value=size):
+                        with patch("time.sleep"):
+                            player._play_gif(tmp_path, loop=False)
+
+                output = stream.getvalue()
+                assert b"\033[4;1H" in output
+                assert b"\033[5;1H" not in output
+
+            finally:
+                tmp_path.unlink()
+
     def test_play_video_opencv_not_installed(self):
         """Test that proper error is raised when OpenCV is not installed."""
         converter = ASCIIConverter()
@@ -242,6 +482,43 @@ class TestASCIIPlayer:
                     Path("test.mp4"), use_color=False, loop=False
                 )
 
+    def test_convert_video_segmented_matches_serial(self):
+        """Test that segmented decoding keeps every frame in order."""
+        cv2 = pytest.importorskip("cv2")
+        converter = ASCIIConverter(width=16, style=ASCIIStyle.SIMPLE)
+        player = ASCIIPlayer(converter, Mock())
+        frame_count = 25
+
+        with tempfile.NamedTemporaryFile(suffix=".avi", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+
+        try:
+            writer = cv2.VideoWriter(
+                str(tmp_path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24)
+            )
+            for i in range(frame_count):
+                # Each frame gets its own brightness so order is observable
+                writer.write(np.full((24, 32, 3), i * 10, dtype=np.uint8))
+            writer.release()
+
+            serial = list(player.convert_video(tmp_path, use_color=True))
+            with patch(
+                "ascii_cinema.player.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as pool:
+                with patch("os.cpu_count", return_value=2):
+                    segmented = list(player.convert_video(tmp_path, use_color=True, segments=4))
+
+            assert len(serial) == frame_count
+            assert segmented == serial
+            assert all(a != b for a, b in pairwise(segmented))
+            # Workers must not be forked from a process running a spinner thread
+            assert pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+            # Four segments share one worker per CPU
+            assert pool.call_args.kwargs["max_workers"] == 2
+
+        finally:
+            tmp_path.unlink()
+
     def test_webcam_opencv_not_installed(self):
         """Test that proper error is raised for webcam when OpenCV not installed."""
         converter = ASCIIConverter()
@@ -282,6 +559,439 @@ class TestASCIIStyle:
         assert chars[-1] in ["@", "$", "#"]
 
 
+class TestRawTerminal:
+    """Test suite for RawTerminal class."""
+
+    def test_encode_wraps_frame_in_synchronized_update(self):
+        """Test that a frame is homed and wrapped in DEC mode 2026."""
+        data = RawTerminal.encode("ab\ncd")
+        assert data == b"\033[?2026h\033[Hab\ncd\033[?2026l"
+
+    def test_encode_rows_positions_each_row(self):
+        """Test that partial updates move the cursor to each changed row."""
+        data = RawTerminal.encode_rows([(0, b"ab"), (3, "cd")])
+        assert data == b"\033[?2026h\033[1;1Hab\033[4;1Hcd\033[?2026l"
+
+    def test_encode_clips_to_screen_height(self):
+        """Test that rows below the screen are dropped instead of scrolling."""
+        data = RawTerminal.encode("a\nb\nc", lines=2)
+        assert data == b"\033[?2026h\033[Ha\nb\033[?2026l"
+
+    def test_encode_rows_skips_rows_below_screen(self):
+        """Test that rows past the last line are not drawn over it."""
+        data = RawTerminal.encode_rows([(0, b"ab"), (3, "cd")], lines=3)
+        assert data == b"\033[?2026h\033[1;1Hab\033[?2026l"
+
+    def test_size_defaults_to_terminal_size(self):
+        """Test that the screen height and width come from the terminal."""
+        with patch("shutil.get_terminal_size", return_value=os.terminal_size((80, 5))):
+            terminal = RawTerminal(io.BytesIO())
+
+        assert terminal.lines == 5
+        assert terminal.columns == 80
+
+    def test_context_turns_off_autowrap(self):
+        """Test that wide rows are cut off instead of wrapping, then restored."""
+        stream = io.BytesIO()
+        with RawTerminal(stream):
+            setup = stream.getvalue()
+
+        assert setup.endswith(b"\033[?7l")
+        assert stream.getvalue().endswith(b"\033[?7h\033[?25h\033[?1049l")
+
+    def test_update_writes_once(self):
+        """Test that each update is a single write of the encoded frame."""
+        stream = Mock()
+        terminal = RawTerminal(stream, lines=1)
+        terminal.update("xy\nzw")
+
+        stream.write.assert_called_once_with(RawTerminal.encode("xy", 1))
+
+    def test_update_accepts_pre_encoded_bytes(self):
+        """Test that pre-encoded frames are written unchanged."""
+        stream = io.BytesIO()
+        RawTerminal(stream).update(b"raw")
+        assert stream.getvalue() == b"raw"
+
+    def test_context_sets_up_and_restores_terminal(self):
+        """Test alternate screen and cursor handling."""
+        stream = io.BytesIO()
+        with RawTerminal(stream) as terminal:
+            setup = stream.getvalue()
+            terminal.update("frame")
+
+        output = stream.getvalue()
+        assert setup.startswith(b"\033[?1049h\033[?25l")
+        assert output.endswith(b"\033[?25h\033[?1049l")
+
+    def test_restores_terminal_on_keyboard_interrupt(self):
+        """Test that Ctrl+C still leaves the terminal usable."""
+        stream = io.BytesIO()
+        with pytest.raises(KeyboardInterrupt):
+            with RawTerminal(stream):
+                raise KeyboardInterrupt
+
+        assert stream.getvalue().endswith(b"\033[?25h\033[?1049l")
+
+    def test_restore_is_idempotent(self):
+        """Test that restoring twice writes nothing more."""
+        stream = io.BytesIO()
+        terminal = RawTerminal(stream)
+        with terminal:
+            pass
+        length = len(stream.getvalue())
+        terminal.restore()
+
+        assert len(stream.getvalue()) == length
+
+    def test_display_backend_str(self):
+        """Test string representation of display backends."""
+        assert str(DisplayBackend.RICH) == "rich"
+        assert str(DisplayBackend.RAW) == "raw"
+
+
+class TestFrameStore:
+    """Test suite for FrameStore class."""
+
+    def test_round_trip(self):
+        """Test that stored frames rebuild to the original text."""
+        store = FrameStore()
+        store.extend(["ab\ncd", "ab\nef"])
+
+        assert len(store) == 2
+        assert store[0] == "ab\ncd"
+        assert store[1] == "ab\nef"
+
+    def test_rows_are_shared(self):
+        """Test that identical rows are stored once across frames."""
+        store = FrameStore()
+        store.extend(["ab\ncd\nab", "ab\nef\nab", "ab\ncd\nab"])
+
+        assert store.rows == ["ab", "cd", "ef"]
+        assert store.refs(0) == store.refs(2) == (0, 1, 0)
+        assert store.refs(1) == (0, 2, 0)
+
+    def test_encoded_rows(self):
+        """Test that encoded stores keep bytes rows but rebuild text."""
+        store = FrameStore(encode=True)
+        store.append("▀▀\n██")
+
+        assert store.rows == ["▀▀".encode(), "██".encode()]
+        assert store[0] == "▀▀\n██"
+
+    def test_merge_shares_rows(self):
+        """Test that merged frames keep their order and reuse existing rows."""
+        store = FrameStore()
+        store.extend(["a\nb", "b\nc"])
+        other = FrameStore()
+        other.extend(["c\nd", "a\nd"])
+        store.merge(other)
+
+        assert [store[i] for i in range(len(store))] == ["a\nb", "b\nc", "c\nd", "a\nd"]
+        assert store.rows == ["a", "b", "c", "d"]
+
+    def test_merge_rejects_mixed_encodings(self):
+        """Test that bytes and text rows are never mixed in one store."""
+        with pytest.raises(ValueError, match="different row encodings"):
+            FrameStore().merge(FrameStore(encode=True))
+
+    def test_changed_rows(self):
+        """Test that only rows with a new reference are reported."""
+        store = FrameStore()
+        store.extend(["a\nb\nc", "a\nx\nc"])
+
+        assert store.changed_rows(None, 0) == [(0, "a"), (1, "b"), (2, "c")]
+        assert store.changed_rows(0, 1) == [(1, "x")]
+        assert store.changed_rows(1, 0) == [(1, "b")]
+        assert store.changed_rows(0, 0) == []
+
+
+@pytest.fixture(params=[KernelBackend.NUMPY, KernelBackend.NUMBA], ids=str)
+def kernels(request):
+    """Every kernel backend, skipping those whose dependency is missing."""
+    if request.param is KernelBackend.NUMBA:
+        pytest.importorskip("numba")
+    return load_kernels(request.param)
+
+
+class TestKernelConformance:
+    """Conformance suite that every kernel backend must pass."""
+
+    reference = NumpyKernels()
+
+    @staticmethod
+    def random_pixels(shape):
+        return np.random.default_rng(7).integers(0, 256, shape, dtype=np.uint8)
+
+    def test_luma_matches_reference_for_every_color(self, kernels):
+        """Test brightness is bit-identical across the whole RGB cube."""
+        values = np.arange(256, dtype=np.uint8)
+        pixels = np.empty((1, 256, 256, 3), dtype=np.uint8)
+        pixels[0, ..., 1:] = np.stack(np.meshgrid(values, values, indexing="ij"), axis=-1)
+
+        # One red plane at a time keeps the float64 results to a few MiB
+        for red in values:
+            pixels[..., 0] = red
+            np.testing.assert_array_equal(kernels.luma(pixels), self.reference.luma(pixels))
+
+    @pytest.mark.parametrize("levels", [2, 5, 10, 70])
+    def test_quantize_matches_reference(self, kernels, levels):
+        """Test glyph indices agree for every character set size."""
+        gray = self.reference.luma(self.random_pixels((4, 30, 40, 3)))
+        gray[0, 0, :3] = [0.0, 255.0, 254.99999999]
+
+        np.testing.assert_array_equal(
+            kernels.quantize(gray, levels), self.reference.quantize(gray, levels)
+        )
+
+    @pytest.mark.parametrize("style", list(ASCIIStyle), ids=str)
+    @pytest.mark.parametrize("shape", [(3, 12, 17, 3), (1, 1, 1, 3), (2, 0, 5, 3)])
+    def test_glyph_map_matches_reference(self, kernels, style, shape):
+        """Test plain text output agrees, including multi-byte glyphs."""
+        pixels = self.random_pixels(shape)
+        indices = self.reference.quantize(self.reference.luma(pixels), len(style.value))
+
+        assert kernels.glyph_map(indices, style.value) == self.reference.glyph_map(
+            indices, style.value
+        )
+
+    @pytest.mark.parametrize("style", list(ASCIIStyle), ids=str)
+    @pytest.mark.parametrize("shape", [(3, 12, 17, 3), (1, 1, 1, 3), (2, 0, 5, 3)])
+    def test_color_encode_matches_reference(self, kernels, style, shape):
+        """Test colored output agrees for one, two and three digit channels."""
+        pixels = self.random_pixels(shape)
+        if pixels.size:
+            pixels[0, 0, 0] = [0, 9, 10]
+            pixels[-1, -1, -1] = [99, 100, 255]
+        indices = self.reference.quantize(self.reference.luma(pixels), len(style.value))
+
+        assert kernels.color_encode(pixels, indices, style.value) == (
+            self.reference.color_encode(pixels, indices, style.value)
+        )
+
+    @pytest.mark.parametrize("shape", [(3, 12, 17, 3), (1, 1, 1, 3), (2, 0, 5, 3)])
+    def test_half_block_encode_matches_reference(self, kernels, shape):
+        """Test half-block output agrees, including runs of repeated colors."""
+        top = self.random_pixels(shape) // 128 * 255
+        bottom = self.random_pixels(shape)[::-1] // 128 * 255
+
+        assert kernels.half_block_encode(top, bottom) == (
+            self.reference.half_block_encode(top, bottom)
+        )
+
+    def test_converter_output_matches_reference(self, kernels):
+        """Test full conversion agrees end to end."""
+        frames = self.random_pixels((4, 48, 64, 3))
+        converter = ASCIIConverter(width=30, backend=KernelBackend.NUMPY)
+        expected = {use_color: converter.frames_to_ascii(frames, use_color) for use_color in (0, 1)}
+
+        converter.kernels = kernels
+        for use_color in (False, True):
+            assert converter.frames_to_ascii(frames, use_color) == expected[use_color]
+
+
+class TestKernelBackend:
+    """Test suite for kernel backend selection."""
+
+    def test_numpy_backend(self):
+        """Test that the NumPy backend can always be chosen."""
+        assert load_kernels(KernelBackend.NUMPY).name == "numpy"
+
+    def test_auto_falls_back_to_numpy(self):
+        """Test that AUTO works when numba is not installed."""
+        with patch.dict("sys.modules", {"ascii_cinema._numba_kernels": None}):
+            assert load_kernels(KernelBackend.AUTO).name == "numpy"
+
+    def test_numba_backend_not_installed(self):
+        """Test that choosing numba without it installed raises a clear error."""
+        with patch.dict("sys.modules", {"ascii_cinema._numba_kernels": None}):
+            with pytest.raises(ImportError, match="numba is required"):
+                load_kernels(KernelBackend.NUMBA)
+
+    def test_backend_from_string(self):
+        """Test that backends can be chosen by name."""
+        assert load_kernels("numpy").name == "numpy"
+
+    def test_converter_uses_backend(self):
+        """Test that the converter loads the requested backend."""
+        converter = ASCIIConverter(backend=KernelBackend.NUMPY)
+        assert isinstance(converter.kernels, NumpyKernels)
+
+
+class TestMemoryProfiler:
+    """Test suite for memory profiling."""
+
+    def test_report_with_frames(self):
+        """Test that the report accounts for cached frames."""
+        frames = FrameStore()
+        frames.extend(["ab\ncd", "ab\nef"])
+
+        with MemoryProfiler(top=3) as profiler:
+            data = [bytearray(1024) for _ in range(100)]
+
+        report = profiler.report(frames)
+        assert profiler.traced_peak >= 100 * 1024
+        assert "peak RSS" in report
+        assert "cached frames:      2 (3 unique rows)" in report
+        assert "bytes per frame" in report
+        assert len(profiler.top_allocators()) <= 3
+        assert data
+
+    def test_report_without_frames(self):
+        """Test the report when nothing was cached."""
+        with MemoryProfiler() as profiler:
+            pass
+
+        assert "cached frames:      0" in profiler.report()
+
+    def test_report_ignores_import_machinery(self):
+        """Test that modules imported while tracing do not crowd the report."""
+        sys.modules.pop("colorsys", None)
+        with MemoryProfiler(top=1000) as profiler:
+            import colorsys  # noqa: F401
+
+        filenames = {stat.traceback[0].filename for stat in profiler.top_allocators()}
+        assert not any(name.startswith(("<frozen importlib", "<frozen abc")) for name in filenames)
+
+    def test_report_labels_child_processes(self):
+        """Test that child process RSS is not attributed to segment workers."""
+        with MemoryProfiler() as profiler:
+            pass
+
+        with patch(
+            "ascii_cinema.profiling.peak_rss",
+            side_effect=lambda children=False: 3 * 1024**2 if children else 1024**2,
+        ):
+            report = profiler.report()
+
+        assert "child peak RSS:     3.0 MiB" in report
+        assert "workers" not in report
+
+    def test_warm_up_runs_the_kernels(self):
+        """Test that warming up converts a tiny frame with the requested kernels."""
+        converter = Mock()
+        warm_up(converter, use_color=True)
+
+        frames, use_color = converter.frames_to_ascii.call_args.args
+        assert frames.shape == (1, 2, 2, 3)
+        assert use_color is True
+
+    def test_stops_tracing_on_keyboard_interrupt(self):
+        """Test that Ctrl+C still stops tracing and keeps the snapshot."""
+        profiler = MemoryProfiler()
+        with pytest.raises(KeyboardInterrupt):
+            with profiler:
+                raise KeyboardInterrupt
+
+        assert not tracemalloc.is_tracing()
+        assert profiler.snapshot is not None
+
+    def test_peak_rss(self):
+        """Test that peak RSS is reported in bytes."""
+        assert peak_rss() > 1024 * 1024
+
+    def test_format_bytes(self):
+        """Test human readable byte counts."""
+        assert format_bytes(512) == "512.0 B"
+        assert format_bytes(1536) == "1.5 KiB"
+        assert format_bytes(3 * 1024**3) == "3.0 GiB"
+
+    def test_frame_store_nbytes_grows_with_unique_rows(self):
+        """Test that repeated frames cost far less than new ones."""
+        repeated = FrameStore()
+        repeated.extend(["x" * 80 + "\n" + "y" * 80] * 100)
+        unique = FrameStore()
+        unique.extend([f"{i:080d}\n{i:080d}" for i in range(100)])
+
+        assert repeated.nbytes * 3 < unique.nbytes
+
+
+# Preloading must intern frames as they are converted, so peak memory may
+# only grow by the size of the frame store when the frame count doubles
+LONG_FRAME_COUNT = 150
+PEAK_BUDGET = {False: 384 * 1024, True: 1024**2}
+PEAK_GROWTH_BUDGET = 128 * 1024
+BYTES_PER_FRAME_BUDGET = 512
+
+
+def _long_animation_frames(count):
+    """Build frames of a bar sliding down a black background."""
+    frames = []
+    for i in range(count):
+        img = Image.new("RGB", (64, 48), color=(0, 0, 0))
+        img.paste((255, 255, 255), (0, i % 44, 64, i % 44 + 4))
+        frames.append(img)
+    return frames
+
+
+def _write_gif(path, count):
+    """Save a synthetic animation as a GIF."""
+    frames = _long_animation_frames(count)
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=10)
+
+
+def _write_video(path, count):
+    """Save a synthetic animation as an MJPG video."""
+    import cv2
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+    for frame in _long_animation_frames(count):
+        writer.write(np.asarray(frame)[:, :, ::-1])
+    writer.release()
+
+
+class TestMemoryBudgets:
+    """Peak-memory budgets for preloading long animations."""
+
+    @staticmethod
+    def preload(write, suffix, count, use_color):
+        """Preload a synthetic animation, returning its frames and peak traced bytes."""
+        converter = ASCIIConverter(
+            width=48, style=ASCIIStyle.STANDARD, backend=KernelBackend.NUMPY
+        )
+        player = ASCIIPlayer(converter, Mock())
+
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+
+        try:
+            write(tmp_path, count)
+            # Skip playback so nothing but the preload is measured
+            with patch.object(ASCIIPlayer, "_play_frames"):
+                tracemalloc.start()
+                try:
+                    player.play_video(tmp_path, use_color=use_color, loop=False)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+        finally:
+            tmp_path.unlink()
+
+        return player.frames, peak
+
+    def check_budgets(self, write, suffix, use_color):
+        """Preload N and 2N frames and compare both against the budgets."""
+        cached, peak = self.preload(write, suffix, LONG_FRAME_COUNT, use_color)
+        doubled, doubled_peak = self.preload(write, suffix, 2 * LONG_FRAME_COUNT, use_color)
+
+        assert len(cached) == LONG_FRAME_COUNT
+        assert len(doubled) == 2 * LONG_FRAME_COUNT
+        assert peak < PEAK_BUDGET[use_color]
+        assert doubled_peak - peak < PEAK_GROWTH_BUDGET
+        assert doubled.nbytes / len(doubled) < BYTES_PER_FRAME_BUDGET
+
+    @pytest.mark.parametrize("use_color", [False, True], ids=["mono", "color"])
+    def test_long_gif_budget(self, use_color):
+        """Test that GIF preload memory does not scale with frame count."""
+        self.check_budgets(_write_gif, ".gif", use_color)
+
+    @pytest.mark.parametrize("use_color", [False, True], ids=["mono", "color"])
+    def test_long_video_budget(self, use_color):
+        """Test that video preload memory does not scale with frame count."""
+        pytest.importorskip("cv2")
+        self.check_budgets(_write_video, ".avi", use_color)
+
+
 class TestIntegration:
     """Integration tests for the complete workflow."""
 